@@ -11,44 +11,48 @@ AUTOCREW_VERSION = "3.1.0"
 
 
 import argparse
+import concurrent.futures
 import configparser
-import copy
-import csv
-import io
 import json
 import logging
-import logging.config
-import ollama
 import os
 import re
 import requests
+import runpy
 import shutil
 import subprocess
 import sys
-import tiktoken
+import tempfile
+import threading
 import time
 
 from logging_config import setup_logging
-from core import AutoCrew
-from datetime import datetime
 from packaging import version
-from typing import Any, Dict, List
-from ast import literal_eval
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from crewai import Agent, Crew, Process, Task
-from langchain_community.llms import Ollama
-from langchain_community.tools import DuckDuckGoSearchRun
-from langchain.callbacks.manager import CallbackManager
-from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
-from openai import OpenAI
+VERSION_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'autocrew', 'version_info.json')
+VERSION_CACHE_TTL = 24 * 60 * 60  # Seconds between live checks of the latest GitHub release
+VERSION_CHECK_TIMEOUT = 5  # Seconds main() waits for the background version check
 
-GREEK_ALPHABETS = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta", "iota", "kappa",
-                       "lambda", "mu", "nu", "xi", "omicron", "pi", "rho", "sigma", "tau", "upsilon"]
+# Shared HTTP session so connections are reused, with one retry for connection failures only
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(max_retries=Retry(total=1, read=0, backoff_factor=0.3)))
+# Connect/read timeouts in seconds. These do not bound the whole request (DNS lookups are not
+# covered and the read timeout applies per socket read), which is why the check runs in a daemon thread.
+VERSION_CHECK_HTTP_TIMEOUT = (3.05, 5)
+
+# Matches a SECTION.KEY=VALUE config parameter given with -c
+_CFG_RE = re.compile(r'^\s*([^.]+?)\s*\.\s*([^=]+?)\s*=\s*(.*?)\s*$')
 
 def clear_screen():
-    # Clear the screen command for different operating systems
-    command = 'cls' if os.name == 'nt' else 'clear'
-    os.system(command)
+    # Windows consoles without VT support still need the cls command
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # Write the ANSI clear sequence directly instead of spawning a shell
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
         
 def log_command_line_arguments():
     logging.info(f"Command-line arguments: {' '.join(sys.argv[1:])}")
@@ -64,10 +68,6 @@ def install_dependencies():
         logging.error("The requirements.txt file is empty.")
         raise ValueError("Empty requirements.txt file.")
 
-    pip_executable = shutil.which('pip') or shutil.which('pip3')
-    if not pip_executable:
-        raise EnvironmentError("pip is not available on the system.")
-
     logging.info("Installing dependencies...")
 
     try:
@@ -75,8 +75,27 @@ def install_dependencies():
             logging.info(f"Contents of {requirements_file}:")
             logging.info(file.read())
 
-        logging.info(f"Executing: {pip_executable} install -r {requirements_file}")
-        subprocess.check_call([pip_executable, 'install', '-r', requirements_file])
+        pip_args = ['install', '-r', requirements_file]
+        try:
+            # Run pip in-process to avoid starting a second Python interpreter
+            from pip._internal.cli.main import main as pip_main
+        except ImportError:
+            # Older pip versions do not expose the internal entry point
+            logging.info(f"Executing: {sys.executable} -m pip {' '.join(pip_args)}")
+            subprocess.check_call([sys.executable, '-m', 'pip'] + pip_args)
+        else:
+            logging.info(f"Executing: pip {' '.join(pip_args)}")
+            # pip reconfigures the root logger, so keep our handlers to put them back afterwards
+            root_logger = logging.getLogger()
+            saved_handlers = root_logger.handlers[:]
+            saved_level = root_logger.level
+            try:
+                exit_code = pip_main(pip_args)
+            finally:
+                root_logger.handlers[:] = saved_handlers
+                root_logger.setLevel(saved_level)
+            if exit_code != 0:
+                raise subprocess.CalledProcessError(exit_code, ['pip'] + pip_args)
 
     except subprocess.CalledProcessError as e:
         logging.error("Error occurred while installing dependencies.")
@@ -98,26 +117,63 @@ def handle_exception(exc_type, exc_value, exc_traceback):
     logging.error("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
 
 def positive_int(value):
-        try:
-            ivalue = int(value)
-            if ivalue <= 0:
-                raise argparse.ArgumentTypeError(f"{value} is an invalid positive int value")
-            return ivalue
-        except ValueError:
-            print("Please specify the total number of alternative scripts to generate: ")
-            while True:
-                try:
-                    return int(input())
-                except ValueError:
-                    print("Invalid input. Please enter a valid number.")             
-
-def check_latest_version():
     try:
-        # Send request to GitHub API to get the latest release version
-        response = requests.get('https://api.github.com/repos/yanniedog/autocrew/releases/latest')
-        response.raise_for_status()  # Raise an exception for HTTP errors
-        latest_release = response.json()
-        latest_version = latest_release['tag_name']
+        ivalue = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not an integer")
+    if ivalue <= 0:
+        raise argparse.ArgumentTypeError(f"{value} is an invalid positive int value")
+    return ivalue
+
+def _read_cached_version(path):
+    """Return the cached release info dictionary, or None if missing or unreadable."""
+    try:
+        with open(path, 'r') as cache_file:
+            cached = json.load(cache_file)
+        if isinstance(cached.get('tag_name'), str) and isinstance(cached.get('fetched_at'), (int, float)):
+            return cached
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+def _write_cached_version(path, tag, etag=None):
+    """Store the latest release tag and its ETag along with the time it was fetched."""
+    temp_path = None
+    try:
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file and swap it in, so concurrent runs never read a partial cache
+        with tempfile.NamedTemporaryFile('w', dir=cache_dir, suffix='.tmp', delete=False) as cache_file:
+            temp_path = cache_file.name
+            json.dump({'tag_name': tag, 'etag': etag, 'fetched_at': time.time()}, cache_file)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logging.debug(f"Unable to write version cache {path}: {e}")
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def check_latest_version(use_cache=True):
+    try:
+        # Use the cached release tag if it was fetched recently, to avoid a network round trip on every run.
+        # With use_cache=False the cached ETag is still sent, so an unchanged release costs only a 304.
+        cached = _read_cached_version(VERSION_CACHE_FILE)
+        if use_cache and cached and 0 <= time.time() - cached['fetched_at'] < VERSION_CACHE_TTL:
+            latest_version = cached['tag_name']
+        else:
+            # Send a conditional request to GitHub API so an unchanged release returns 304 Not Modified
+            etag = cached.get('etag') if cached else None
+            headers = {'If-None-Match': etag} if etag else {}
+            response = _SESSION.get('https://api.github.com/repos/yanniedog/autocrew/releases/latest',
+                                    headers=headers, timeout=VERSION_CHECK_HTTP_TIMEOUT)
+            if response.status_code == 304 and cached:
+                latest_version = cached['tag_name']
+            else:
+                response.raise_for_status()  # Raise an exception for HTTP errors
+                # GitHub always returns UTF-8, so decode the raw bytes and skip charset detection
+                latest_release = json.loads(response.content)
+                latest_version = latest_release['tag_name']
+                etag = response.headers.get('ETag')
+            _write_cached_version(VERSION_CACHE_FILE, latest_version, etag)
 
         # Compare the latest version from GitHub with the current version
         if version.parse(latest_version) > version.parse(AUTOCREW_VERSION):
@@ -154,10 +210,12 @@ def upgrade_autocrew(latest_version):
             logging.info(f"Backing up {src_path} to {backup_path}...")
 
     update_dir = 'autocrew_update'
-    shutil.rmtree(update_dir, ignore_errors=True)
+    if os.path.isdir(update_dir):
+        shutil.rmtree(update_dir, ignore_errors=True)
 
-    # Clone the latest version from GitHub
-    git_clone_result = subprocess.run(['git', 'clone', 'https://github.com/yanniedog/autocrew.git', update_dir], 
+    # Shallow clone of the latest release only, since the history is not needed
+    git_clone_result = subprocess.run(['git', 'clone', '--depth=1', '--single-branch', '--branch', latest_version,
+                                       'https://github.com/yanniedog/autocrew.git', update_dir],
                                       capture_output=True, text=True)
 
     if git_clone_result.returncode != 0:
@@ -167,20 +225,27 @@ def upgrade_autocrew(latest_version):
         raise RuntimeError("Failed to clone the AutoCrew repository.")
 
     # File update with confirmation
-    for filename in os.listdir(update_dir):
-        source_path = os.path.join(update_dir, filename)
-        if os.path.isfile(source_path) and filename != 'config.ini':
-            confirmation = input(f"Do you want to overwrite {filename}? (yes/no): ").lower()
-            if confirmation == 'yes':
-                shutil.copyfile(source_path, filename)
-                logging.info(f"Copied {filename} to the current directory.")
-            else:
-                logging.info(f"Skipped updating {filename}.")
+    # Collect all confirmations first so the files are then updated back to back
+    files_to_update = []
+    with os.scandir(update_dir) as entries:
+        for entry in entries:
+            filename = entry.name
+            if entry.is_file(follow_symlinks=False) and filename != 'config.ini':
+                confirmation = input(f"Do you want to overwrite {filename}? (yes/no): ").lower()
+                if confirmation == 'yes':
+                    files_to_update.append((entry.path, filename))
+                else:
+                    logging.info(f"Skipped updating {filename}.")
+
+    for source_path, filename in files_to_update:
+        os.replace(source_path, filename)
+        logging.info(f"Moved {filename} to the current directory.")
 
     # Update config.ini with previous settings
     update_config_file(update_dir, backup_dir)
 
-    shutil.rmtree(update_dir)
+    if os.path.isdir(update_dir):
+        shutil.rmtree(update_dir)
     logging.info("Upgrade process completed.")
     print(f"Upgrade successful. AutoCrew has been updated from version {AUTOCREW_VERSION} to version {latest_version}.")
     sys.exit(0)
@@ -211,13 +276,12 @@ def parse_config_parameters(config_params):
     """
     config_dict = {}
     for param in config_params:
-        try:
-            section, key_value = param.split('.', 1)
-            key, value = key_value.split('=', 1)
-            # Strip whitespace and keep the value as a string
-            config_dict.setdefault(section.strip(), {})[key.strip()] = value.strip()
-        except ValueError:
+        match = _CFG_RE.match(param)
+        if not match:
             raise argparse.ArgumentTypeError(f"Invalid config parameter format: {param}")
+        # Whitespace is stripped by the pattern and the value is kept as a string
+        section, key, value = match.groups()
+        config_dict.setdefault(section, {})[key] = value
     return config_dict
 
 def update_config_file_with_params(config_dict, write_to_file=False):
@@ -286,9 +350,20 @@ def generate_and_run_scripts(args, autocrew, truncated_overall_goal):
             csv_file_paths = autocrew.generate_scripts(truncated_overall_goal, num_scripts_to_generate)
 
             if args.a:
-                for path in csv_file_paths:
-                    script_path = path.replace('.csv', '.py')
-                    subprocess.run([sys.executable, script_path])
+                script_paths = [path.replace('.csv', '.py') for path in csv_file_paths]
+                max_workers = min(len(script_paths), autocrew.parallel_runs, os.cpu_count() or 4)
+                if max_workers <= 1:
+                    # Run the scripts one after another for reproducible output
+                    results = [subprocess.run([sys.executable, script_path]) for script_path in script_paths]
+                else:
+                    # The generated scripts are independent, so run them concurrently
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        futures = [executor.submit(subprocess.run, [sys.executable, script_path])
+                                   for script_path in script_paths]
+                        results = [future.result() for future in futures]
+                for script_path, result in zip(script_paths, results):
+                    if result.returncode != 0:
+                        logging.error(f"Script {script_path} exited with return code {result.returncode}.")
         except Exception as e:
             logging.exception("An error occurred during script generation.")
             sys.exit(1)
@@ -314,6 +389,26 @@ def handle_ranking(args, autocrew, truncated_overall_goal, csv_file_paths):
             logging.exception("An error occurred during script ranking.")
             sys.exit(1)
 
+def start_version_check(use_cache=True):
+    """Run check_latest_version() in a daemon thread, so a hung request never delays interpreter exit."""
+    version_future = concurrent.futures.Future()
+
+    def run_check():
+        try:
+            version_future.set_result(check_latest_version(use_cache))
+        except Exception as e:
+            version_future.set_exception(e)
+
+    threading.Thread(target=run_check, name='autocrew-version-check', daemon=True).start()
+    return version_future
+
+def wait_for_version_check(version_future):
+    """Return the result of the background version check, or a fallback if it takes too long."""
+    try:
+        return version_future.result(timeout=VERSION_CHECK_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        return AUTOCREW_VERSION, "Version check timed out."
+
 def generate_startup_message(latest_version, version_message):
     startup_message = ("\nWelcome to AutoCrew!\n" +
                        "Use the -? or -h command line options to display help information.\n" +
@@ -372,36 +467,46 @@ def main():
     if len(sys.argv) == 1:
         # No command-line parameters provided, run the interactive setup script
         print("\nWelcome to AutoCrew!\nLet's get started.\n")
-        subprocess.run(['python3', 'welcome.py'])
+        # Run welcome.py in this interpreter to reuse the modules that are already loaded.
+        # welcome.py imports from autocrew, so register this script under that name to avoid loading it twice.
+        sys.modules.setdefault('autocrew', sys.modules[__name__])
+        runpy.run_path('welcome.py', run_name='__main__')
         sys.exit(0)
-    
+
     args, parser = parse_arguments()
     log_command_line_arguments()
 
     try:
-        # Check for the latest version
-        latest_version, version_message = check_latest_version()
-        startup_message = generate_startup_message(latest_version, version_message)
-        logging.info(startup_message)
-
-        # Handle help, install dependencies, and upgrade before proceeding
+        # Handle help and install dependencies first, as they do not need the version check
         handle_help(args, parser)
         handle_install_dependencies(args)
-        handle_upgrade(args, latest_version)
 
-        # Update config if specified
-        handle_config_update(args)
+        # Check for the latest version in the background while AutoCrew is set up.
+        # An explicit upgrade must not act on a cached tag that may be up to a day old.
+        version_future = start_version_check(use_cache=not args.u)
+
+        # The upgrade needs the latest version straight away, so there is nothing to overlap with
+        if not args.u:
+            # Update config if specified
+            handle_config_update(args)
+
+            # Imported here so that -h, -d and -u do not pay for loading crewai, langchain and openai
+            from core import AutoCrew
+            autocrew = AutoCrew()
+            autocrew.log_config_with_redacted_api_keys()
+
+        latest_version, version_message = wait_for_version_check(version_future)
+        startup_message = generate_startup_message(latest_version, version_message)
+        logging.info(startup_message)
 
-        autocrew = AutoCrew()
-        autocrew.log_config_with_redacted_api_keys()
+        # Handle upgrade before proceeding
+        handle_upgrade(args, latest_version)
 
         if not args.overall_goal:
             args.overall_goal = input("Please set the overall goal for your crew: ")
 
         # Truncate the overall_goal according to the setting in config.ini
-        config = configparser.ConfigParser()
-        config.read('config.ini')
-        max_length = config.getint('CREWAI_SCRIPTS', 'overall_goal_truncation_for_filenames', fallback=40)
+        max_length = autocrew.overall_goal_truncation_for_filenames
         truncated_overall_goal = truncate_overall_goal(args.overall_goal, max_length)
 
         # Script Generation and Ranking Process
@@ -20,7 +20,6 @@ from typing import Any, Dict, List
 
 # External libraries imports
 from packaging import version
-from openai import OpenAI
 from datetime import datetime
 
 
@@ -28,13 +27,8 @@ from datetime import datetime
 from utils import (
     count_tokens, get_next_crew_name, parse_csv_data,
     save_csv_output, write_crewai_script, countdown_timer,
-    redact_api_key, GREEK_ALPHABETS
+    redact_api_key, GREEK_ALPHABETS, GREEK_ALPHABETS_SET
 )
-from crewai import Agent, Crew, Process, Task
-from langchain_community.llms import Ollama
-from langchain_community.tools import DuckDuckGoSearchRun
-from langchain.callbacks.manager import CallbackManager
-from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
 
 
     
@@ -66,6 +60,7 @@ class AutoCrew():
         self.add_api_keys_to_crewai_scripts = self.config.getboolean('CREWAI_SCRIPTS', 'add_api_keys_to_crewai_scripts', fallback=False)
         self.add_ollama_host_url_to_crewai_scripts = self.config.getboolean('CREWAI_SCRIPTS', 'add_ollama_host_url_to_crewai_scripts', fallback=False)
         self.overall_goal_truncation_for_filenames = self.config.getint('CREWAI_SCRIPTS', 'overall_goal_truncation_for_filenames', fallback=40)
+        self.parallel_runs = max(1, self.config.getint('CREWAI_SCRIPTS', 'parallel_runs', fallback=1))
 
         # AUTHENTICATORS section
         self.openai_api_key = self.config.get('AUTHENTICATORS', 'openai_api_key', fallback=None)
@@ -109,6 +104,9 @@ class AutoCrew():
         logging.info(f"Ollama host: {self.ollama_host}")
 
         try:
+            from langchain_community.llms import Ollama
+            from langchain.callbacks.manager import CallbackManager
+            from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
             return Ollama(base_url=self.ollama_host, model=self.llm_model, verbose=True, callback_manager=CallbackManager([StreamingStdOutCallbackHandler()]))
         except Exception as e:
             logging.error(f"Failed to initialize Ollama: {e}")
@@ -181,6 +179,7 @@ class AutoCrew():
                 logging.debug(f"Number of tokens in the response: {count_tokens(response)}")
                 return response
             elif self.llm_endpoint == 'openai' and self.openai_api_key:
+                from openai import OpenAI
                 client = OpenAI(api_key=self.openai_api_key)
                 chat_completion = client.chat.completions.create(
                     model=self.openai_model,  # Use the model directly from the configuration
@@ -319,6 +318,7 @@ class AutoCrew():
         return ranked_crews, overall_summary
 
     def get_openai_response(self, prompt, max_tokens):
+        from openai import OpenAI
         client = OpenAI(api_key=self.openai_api_key)
         chat_completion = client.chat.completions.create(
             model=self.openai_model,
@@ -355,7 +355,7 @@ class AutoCrew():
 
     def extract_csv_data(self, file_path):
         crew_name = os.path.basename(file_path).split('-')[-1].split('.')[0]
-        if crew_name.lower() not in GREEK_ALPHABETS:
+        if crew_name.lower() not in GREEK_ALPHABETS_SET:
             logging.debug(f"Skipping file {file_path} as it does not end with a Greek letter.")
             return None, None
 
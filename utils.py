@@ -6,20 +6,22 @@ import logging
 import os
 import re
 import time
-import tiktoken
 from textwrap import dedent
 from datetime import datetime
 
 
 
-GREEK_ALPHABETS = [
+GREEK_ALPHABETS = (
     "alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta",
     "iota", "kappa", "lambda", "mu", "nu", "xi", "omicron", "pi", "rho",
     "sigma", "tau", "upsilon"
-]
+)
+# Use this set rather than the tuple for membership tests
+GREEK_ALPHABETS_SET = frozenset(GREEK_ALPHABETS)
 
 def count_tokens(string: str) -> int:
     """Returns the number of tokens in a text string."""
+    import tiktoken  # Imported lazily as it is slow to load
     encoding_name = 'cl100k_base'  # Assuming this is the encoding you want to use
     encoding = tiktoken.get_encoding(encoding_name)
     num_tokens = len(encoding.encode(string))
@@ -34,7 +36,7 @@ def get_next_crew_name(overall_goal, script_directory="scripts"):
     formatted_goal = overall_goal.replace(" ", "-")
     existing_files = [f for f in os.listdir(directory) if (f.endswith('.csv') or f.endswith('.py')) and formatted_goal in f]
     existing_crew_names = [f.split('-')[-1].split('.')[0] for f in existing_files]
-    existing_crew_indices = [GREEK_ALPHABETS.index(name) for name in existing_crew_names if name in GREEK_ALPHABETS]
+    existing_crew_indices = [GREEK_ALPHABETS.index(name) for name in existing_crew_names if name in GREEK_ALPHABETS_SET]
 
     # Find the next available Greek alphabet name
     for i, name in enumerate(GREEK_ALPHABETS):